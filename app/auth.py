@@ -1,19 +1,39 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError as JWTError
 from pydantic import BaseModel
 from datetime import datetime, timedelta, timezone
 from typing import Optional
+from cachetools import TTLCache
+from calendar import timegm
+import base64
+import hashlib
+import hmac
+import orjson
 import os
+import time
 
 # Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+TOKEN_CACHE_TTL_SECONDS = int(os.getenv("JWT_CACHE_TTL_SECONDS", "60"))
+TOKEN_CACHE_MAX_SIZE = 10_000
 
 security = HTTPBearer(auto_error=False)
 
+# Decoded claims of signature-checked tokens, keyed by the SHA-256 digest of the raw token
+# so entry size stays bounded. Only the signature/JSON decode is cached; time-based claims
+# are re-validated on every call, so a cached token is never accepted past its expiry.
+_token_cache: TTLCache = TTLCache(maxsize=TOKEN_CACHE_MAX_SIZE, ttl=TOKEN_CACHE_TTL_SECONDS)
+
+# HS256 signing state built once: the header segment never changes and the keyed HMAC is
+# copied per token, which skips re-deriving the key pads on every call.
+_JWT_DATETIME_CLAIMS = ("exp", "iat", "nbf")
+_signer = hmac.new(SECRET_KEY.encode(), digestmod=hashlib.sha256)
+
 
 class User(BaseModel):
     user_id: str
@@ -35,29 +55,72 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = _encode_hs256(to_encode)
     return encoded_jwt
 
 
-def verify_token(token: str) -> TokenData:
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        role: str = payload.get("role")
-        
-        if user_id is None:
+def _b64url(raw: bytes) -> bytes:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=")
+
+
+_JWT_HEADER_SEGMENT = _b64url(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+
+
+def _encode_hs256(claims: dict) -> str:
+    """
+    Sign claims as a standard HS256 JWT that jwt.decode verifies. Not byte-identical to
+    jwt.encode: orjson writes non-ASCII claim values as raw UTF-8 where PyJWT escapes them.
+    """
+    for claim in _JWT_DATETIME_CLAIMS:
+        if isinstance(claims.get(claim), datetime):
+            claims[claim] = timegm(claims[claim].utctimetuple())
+    signing_input = _JWT_HEADER_SEGMENT + b"." + _b64url(orjson.dumps(claims))
+    signer = _signer.copy()
+    signer.update(signing_input)
+    return (signing_input + b"." + _b64url(signer.digest())).decode()
+
+
+def _decode_claims(token: str) -> dict:
+    """Check the token signature and decode its claims, memoised per token."""
+    cache_key = hashlib.sha256(token.encode()).digest()
+    claims = _token_cache.get(cache_key)
+    if claims is None:
+        try:
+            claims = jwt.decode(
+                token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": False}
+            )
+        except JWTError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials"
             )
-        
-        return TokenData(user_id=user_id, role=role)
-    except JWTError:
+        _token_cache[cache_key] = claims
+    return claims
+
+
+def _validate_claims(claims: dict) -> TokenData:
+    """Run the checks that depend on the current time or claim contents."""
+    exp = claims.get("exp")
+    if exp is not None and (not isinstance(exp, (int, float)) or exp <= time.time()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials"
+        )
+
+    user_id: str = claims.get("sub")
+    role: str = claims.get("role")
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials"
         )
 
+    return TokenData(user_id=user_id, role=role)
+
+
+def verify_token(token: str) -> TokenData:
+    return _validate_claims(_decode_claims(token))
+
 
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
@@ -4,10 +4,40 @@ import logging
 from typing import Optional
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+__all__ = ["MongoDB", "CLIENT_OPTIONS", "ORDER_INDEXES"]
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Client tuning; every value can be overridden per deployment through the environment.
+# zstd needs the pymongo[zstd] extra; pymongo skips (with a warning) any compressor it can't load.
+CLIENT_OPTIONS = {
+    "maxPoolSize": int(os.getenv("MONGODB_MAX_POOL_SIZE", "200")),
+    "minPoolSize": int(os.getenv("MONGODB_MIN_POOL_SIZE", "10")),
+    "compressors": os.getenv("MONGODB_COMPRESSORS", "zstd,zlib"),
+    "serverSelectionTimeoutMS": int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "3000")),
+    # fail fast with a pool-exhausted error instead of queueing requests indefinitely
+    "waitQueueTimeoutMS": int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "2000")),
+    "retryWrites": True,
+    "retryReads": True,
+}
+
+# Statuses admins poll for; terminal ones make up most of the collection and aren't worth indexing alone
+ACTIVE_ORDER_STATUSES = ["Pending", "Processing"]
+
+# Indexes backing list_orders: equality on user_id and/or status, newest first.
+ORDER_INDEXES = [
+    IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)]),
+    IndexModel(
+        [("status", ASCENDING), ("created_at", DESCENDING)],
+        name="active_status_created_at",
+        partialFilterExpression={"status": {"$in": ACTIVE_ORDER_STATUSES}},
+    ),
+    IndexModel([("user_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)]),
+]
+
 
 class MongoDB:
     """
@@ -37,7 +67,7 @@ class MongoDB:
         """Create the AsyncIOMotorClient once and reuse it."""
         if MongoDB._client is None:
             logger.info("Creating AsyncIOMotorClient for URI: %s", self._uri)
-            MongoDB._client = AsyncIOMotorClient(self._uri)
+            MongoDB._client = AsyncIOMotorClient(self._uri, **CLIENT_OPTIONS)
         return MongoDB._client
 
     @property
@@ -62,6 +92,13 @@ class MongoDB:
         """Convenience to get a collection from the configured (or provided) database."""
         return self.get_database(db_name)[collection_name]
 
+    async def create_indexes(self, db_name: Optional[str] = None) -> None:
+        """
+        Create the order indexes in a single createIndexes command.
+        Safe to call on every startup: existing identical indexes are a no-op on the server.
+        """
+        await self.get_collection("orders", db_name).create_indexes(ORDER_INDEXES)
+
     def close(self) -> None:
         """
         Close the shared Motor client and clear the singleton.
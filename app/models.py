@@ -1,11 +1,13 @@
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, field_serializer, field_validator, model_validator
 from typing import List, Optional, Literal
 from datetime import datetime, timezone
 from bson import ObjectId
+import math
 
 
 def time_to_str(time: datetime):
-    return time.strftime("%Y-%m-%d %H:%M:%S").replace(' ', 'T') + 'Z'
+    # isoformat is the C fast path; dropping tzinfo keeps the offset out (the value is UTC)
+    return time.replace(tzinfo=None).isoformat(timespec="seconds") + 'Z'
 
 
 class OrderItem(BaseModel):
@@ -31,13 +33,16 @@ class OrderCreate(BaseModel):
         return self
 
     def _calculate_total_price(self):
-        self.total_price = sum(item.price * item.quantity for item in self.items)
+        self.total_price = math.fsum(item.price * item.quantity for item in self.items)
     
     def _set_timestamps(self):
         current_time: datetime = datetime.now(timezone.utc)
         if self.created_at is None:
             self.created_at = current_time
-        self.created_at = self.created_at.replace(tzinfo=timezone.utc) #  make sure timezone is UTC
+        elif self.created_at.tzinfo is None:
+            self.created_at = self.created_at.replace(tzinfo=timezone.utc) #  naive values are UTC
+        elif self.created_at.utcoffset():
+            self.created_at = self.created_at.astimezone(timezone.utc)
         if self.created_at > current_time:
             raise ValueError("Created at cannot be in the future")
         if self.updated_at is None:
@@ -58,24 +63,28 @@ class OrderUpdate(BaseModel):
     
     def _update_total_price(self):
         if self.items is not None:
-            self.total_price = sum(item.price * item.quantity for item in self.items)
+            self.total_price = math.fsum(item.price * item.quantity for item in self.items)
     
     def _set_update_time(self):
         self.updated_at = datetime.now(timezone.utc)
 
 
 class OrderResponse(OrderCreate):
-    id: ObjectId = Field(alias="_id")
-    
-    model_config = {                  
-        "json_encoders": {
-            ObjectId: str,
-            datetime: time_to_str,
-        },
+    id: str = Field(alias="_id")
+
+    model_config = {
         "populate_by_name": True,
-        "arbitrary_types_allowed": True,
     }
 
+    @field_validator("id", mode="before")
+    @classmethod
+    def _stringify_id(cls, value):
+        return str(value) if isinstance(value, ObjectId) else value
+
+    @field_serializer("created_at", "updated_at", when_used="json-unless-none")
+    def _serialize_time(self, value: datetime) -> str:
+        return time_to_str(value)
+
 
 class OrderListResponse(BaseModel):
     orders: List[OrderResponse]
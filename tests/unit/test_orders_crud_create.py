@@ -1,8 +1,56 @@
+import asyncio
+import copy
+import re
 import pytest
 from typing import Dict, Any
+from bson import ObjectId
 from starlette import status
-from fastapi.testclient import TestClient
-from tests.conftest import FASTAPI_BASE_URL
+from httpx import AsyncClient
+from pymongo.collection import Collection
+from tests.conftest import FASTAPI_BASE_URL, json_body
+
+ORDERS_URL = f"{FASTAPI_BASE_URL}/orders"
+BATCH_ORDERS_URL = f"{ORDERS_URL}/batch"
+
+# Declarative invalid-payload table: (field path in _VALID_PAYLOAD, replacement, expected status).
+# _MISSING removes the field instead of replacing it; user_id is filled in per test.
+_MISSING = object()
+_VALID_PAYLOAD = {
+    "user_id": None,
+    "items": [{"product_id": "p001", "name": "Laptop", "price": 1200.00, "quantity": 1}],
+}
+INVALID_PAYLOAD_CASES = [
+    ("user_id", _MISSING, status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ("items", _MISSING, status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ("items", [], status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ("items[0].price", -1200.00, status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ("items[0].quantity", 0, status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ("items[0].quantity", -5, status.HTTP_422_UNPROCESSABLE_ENTITY),
+]
+
+
+def _set_field(payload: Dict[str, Any], field_path: str, value: Any) -> None:
+    """Replace (or, for _MISSING, delete) the field at a dotted path like items[0].price."""
+    keys = [int(key) if key.isdigit() else key for key in re.findall(r"\w+", field_path)]
+    *parents, last = keys
+    for key in parents:
+        payload = payload[key]
+    if value is _MISSING:
+        del payload[last]
+    else:
+        payload[last] = value
+
+
+def _case_id(field_path: str, value: Any) -> str:
+    return f"{field_path}-missing" if value is _MISSING else f"{field_path}={value!r}"
+
+# Pre-serialized body for the common single-item order; only user_id and quantity vary
+_ORDER_TEMPLATE = b'{"user_id":"%s","items":[{"product_id":"p1","name":"Item","price":100,"quantity":%d}]}'
+_JSON_CONTENT_TYPE = {"content-type": "application/json"}
+
+
+def _order_body(user_id: str, quantity: int = 1) -> bytes:
+    return _ORDER_TEMPLATE % (user_id.encode(), quantity)
 
 # ============================================================================
 # TEST CLASS: Valid Order Creation
@@ -10,12 +58,13 @@ from tests.conftest import FASTAPI_BASE_URL
 
 @pytest.mark.crud
 @pytest.mark.create
+@pytest.mark.asyncio
 class TestCreateOrderSuccess:
     """Test successful order creation scenarios."""
 
-    def test_create_order_with_valid_data_success(
+    async def test_create_order_with_valid_data_success(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
     ):
@@ -40,22 +89,22 @@ class TestCreateOrderSuccess:
             ],
         }
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
+        response = await async_client.post(
+            ORDERS_URL,
             json=order_data,
             headers=auth_headers
         )
 
         assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
+        data = json_body(response)
         assert data["user_id"] == test_user["user_id"]
         assert data["status"] == "Pending"
         assert data["total_price"] == 1200.00
         assert "_id" in data  # Order ID assigned
 
-    def test_create_order_with_multiple_items(
+    async def test_create_order_with_multiple_items(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
     ):
@@ -91,14 +140,14 @@ class TestCreateOrderSuccess:
             ],
         }
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
+        response = await async_client.post(
+            ORDERS_URL,
             json=order_data,
             headers=auth_headers
         )
 
         assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
+        data = json_body(response)
         assert len(data["items"]) == 3
         assert data["total_price"] == 1450.00
 
@@ -113,9 +162,9 @@ class TestCreateOrderSuccess:
             {"product_id": "p2", "name": "Item2", "price": 250.00, "quantity": 1}
         ]),
     ])
-    def test_create_order_various_prices(
+    async def test_create_order_various_prices(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
         total_price: float,
@@ -131,14 +180,14 @@ class TestCreateOrderSuccess:
             "items": items,
         }
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
+        response = await async_client.post(
+            ORDERS_URL,
             json=order_data,
             headers=auth_headers
         )
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert response.json()["total_price"] == total_price
+        assert json_body(response)["total_price"] == total_price
 
 
 # ============================================================================
@@ -148,84 +197,46 @@ class TestCreateOrderSuccess:
 @pytest.mark.crud
 @pytest.mark.create
 @pytest.mark.validation
+@pytest.mark.asyncio
 class TestCreateOrderValidation:
     """Test input validation for order creation."""
 
-    def test_create_order_missing_user_id(
+    @pytest.mark.parametrize(
+        "field_path,value,expected_status",
+        INVALID_PAYLOAD_CASES,
+        ids=[_case_id(path, value) for path, value, _ in INVALID_PAYLOAD_CASES],
+    )
+    async def test_create_order_invalid_payload(
         self,
-        sync_client: TestClient,
-        auth_headers: Dict[str, str],
-    ):
-        """
-        TEST: Creating order without user_id fails with 422.
-        
-        Verifies:
-        - user_id is required field
-        - API rejects missing user_id
-        - Returns proper error status
-        """
-        order_data = {
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-        }
-
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
-            json=order_data,
-            headers=auth_headers
-        )
-
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    def test_create_order_missing_items(
-        self,
-        sync_client: TestClient,
-        auth_headers: Dict[str, str],
-        test_user: Dict[str, Any],
-    ):
-        """
-        TEST: Creating order without items fails with 422.
-        
-        Verifies:
-        - items is required field
-        - API rejects missing items
-        """
-        order_data = {
-            "user_id": test_user["user_id"],
-        }
-
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
-            json=order_data,
-            headers=auth_headers
-        )
-
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    def test_create_order_empty_items_array(
-        self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
+        field_path: str,
+        value: Any,
+        expected_status: int,
     ):
         """
-        TEST: Creating order with empty items array fails with 422.
+        TEST: Creating order with one field of a valid body broken fails.
         
+        Generated from INVALID_PAYLOAD_CASES: each case removes or replaces
+        a single field of _VALID_PAYLOAD.
         Verifies:
-        - items array cannot be empty
-        - API validates array is not empty
+        - API rejects the payload with the expected status
+        - Error message references the offending field
         """
-        order_data = {
-            "user_id": test_user["user_id"],
-            "items": [],
-        }
+        order_data = copy.deepcopy(_VALID_PAYLOAD)
+        order_data["user_id"] = test_user["user_id"]
+        _set_field(order_data, field_path, value)
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
+        response = await async_client.post(
+            ORDERS_URL,
             json=order_data,
             headers=auth_headers
         )
 
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.status_code == expected_status
+        field_name = re.sub(r"\[\d+\]", "", field_path).rsplit(".", 1)[-1]
+        assert field_name.encode() in response.content.lower()
 
 
 # ============================================================================
@@ -235,47 +246,13 @@ class TestCreateOrderValidation:
 @pytest.mark.crud
 @pytest.mark.create
 @pytest.mark.validation
+@pytest.mark.asyncio
 class TestCreateOrderPriceValidation:
     """Test price validation for order creation."""
 
-    def test_create_order_negative_price(
-        self,
-        sync_client: TestClient,
-        auth_headers: Dict[str, str],
-        test_user: Dict[str, Any],
-    ):
-        """
-        TEST: Creating order with negative price fails with 422.
-        
-        Verifies:
-        - Negative prices rejected
-        - API validates price is positive
-        - Error message references 'price'
-        """
-        order_data = {
-            "user_id": test_user["user_id"],
-            "items": [
-                {
-                    "product_id": "p001",
-                    "name": "Laptop",
-                    "price": -1200.00,
-                    "quantity": 1
-                }
-            ],
-        }
-
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
-            json=order_data,
-            headers=auth_headers
-        )
-
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-        assert "price" in str(response.json()).lower()
-
-    def test_create_order_zero_price(
+    async def test_create_order_zero_price(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
     ):
@@ -297,17 +274,14 @@ class TestCreateOrderPriceValidation:
             ],
         }
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
+        response = await async_client.post(
+            ORDERS_URL,
             json=order_data,
             headers=auth_headers
         )
 
-        # Depending on business logic:
-        # If zero prices not allowed: assert response.status_code == 422
-        # If zero prices allowed: assert response.status_code == 201
-        # Document the actual behavior
-        assert response.status_code in [status.HTTP_201_CREATED, status.HTTP_422_UNPROCESSABLE_ENTITY]
+        # OrderItem.price is gt=0, so free items are rejected
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
 # ============================================================================
@@ -317,103 +291,36 @@ class TestCreateOrderPriceValidation:
 @pytest.mark.crud
 @pytest.mark.create
 @pytest.mark.validation
+@pytest.mark.asyncio
 class TestCreateOrderQuantityValidation:
     """Test quantity validation for order items."""
 
-    def test_create_order_with_zero_quantity(
-        self,
-        sync_client: TestClient,
-        auth_headers: Dict[str, str],
-        test_user: Dict[str, Any],
-    ):
-        """
-        TEST: Creating order with zero quantity fails with 422.
-        
-        Verifies:
-        - Quantity must be positive
-        - API rejects zero quantity
-        """
-        order_data = {
-            "user_id": test_user["user_id"],
-            "items": [
-                {
-                    "product_id": "p001",
-                    "name": "Laptop",
-                    "price": 1200.00,
-                    "quantity": 0
-                }
-            ],
-        }
-
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
-            json=order_data,
-            headers=auth_headers
-        )
-
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    def test_create_order_with_negative_quantity(
+    async def test_create_order_valid_quantities(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
-    ):
-        """
-        TEST: Creating order with negative quantity fails with 422.
-        """
-        order_data = {
-            "user_id": test_user["user_id"],
-            "items": [
-                {
-                    "product_id": "p001",
-                    "name": "Laptop",
-                    "price": 1200.00,
-                    "quantity": -5
-                }
-            ],
-        }
-
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
-            json=order_data,
-            headers=auth_headers
-        )
-
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    @pytest.mark.parametrize("quantity", [1, 5, 10, 100, 1000])
-    def test_create_order_valid_quantities(
-        self,
-        sync_client: TestClient,
-        auth_headers: Dict[str, str],
-        test_user: Dict[str, Any],
-        quantity: int,
     ):
         """
         TEST: Create orders with various valid quantities.
         
-        Parameterized test for valid quantity values.
+        All quantities are submitted concurrently and checked together.
         """
-        order_data = {
-            "user_id": test_user["user_id"],
-            "items": [
-                {
-                    "product_id": "p001",
-                    "name": "Item",
-                    "price": 100.00,
-                    "quantity": quantity
-                }
-            ],
-        }
+        quantities = [1, 5, 10, 100, 1000]
+        headers = {**auth_headers, **_JSON_CONTENT_TYPE}
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
-            json=order_data,
-            headers=auth_headers
-        )
+        responses = await asyncio.gather(*(
+            async_client.post(
+                ORDERS_URL,
+                content=_order_body(test_user["user_id"], quantity),
+                headers=headers
+            )
+            for quantity in quantities
+        ))
 
-        assert response.status_code == status.HTTP_201_CREATED
+        for quantity, response in zip(quantities, responses):
+            assert response.status_code == status.HTTP_201_CREATED, quantity
+            assert json_body(response)["items"][0]["quantity"] == quantity
 
 
 # ============================================================================
@@ -423,12 +330,17 @@ class TestCreateOrderQuantityValidation:
 @pytest.mark.crud
 @pytest.mark.create
 @pytest.mark.auth
+@pytest.mark.no_db
+@pytest.mark.asyncio
 class TestCreateOrderAuthentication:
-    """Test authentication and authorization for order creation."""
+    """
+    Test authentication and authorization for order creation.
+    Every request here is rejected before the handler writes, so no DB fixtures are used.
+    """
 
-    def test_create_order_without_authentication(
+    async def test_create_order_without_authentication(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
     ):
         """
         TEST: Creating order without authentication fails with 401.
@@ -437,21 +349,17 @@ class TestCreateOrderAuthentication:
         - Authentication required
         - Unauthenticated requests rejected
         """
-        order_data = {
-            "user_id": "test_user",
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-        }
-
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
-            json=order_data
+        response = await async_client.post(
+            ORDERS_URL,
+            content=_order_body("test_user"),
+            headers=_JSON_CONTENT_TYPE
         )
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_create_order_with_invalid_token(
+    async def test_create_order_with_invalid_token(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
     ):
         """
         TEST: Creating order with invalid JWT token fails with 401.
@@ -460,25 +368,20 @@ class TestCreateOrderAuthentication:
         - Invalid tokens rejected
         - API validates token format and signature
         """
-        invalid_headers = {"Authorization": "Bearer invalid_token_here"}
-        order_data = {
-            "user_id": "test_user",
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-        }
+        invalid_headers = {"Authorization": "Bearer invalid_token_here", **_JSON_CONTENT_TYPE}
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
-            json=order_data,
+        response = await async_client.post(
+            ORDERS_URL,
+            content=_order_body("test_user"),
             headers=invalid_headers
         )
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_create_order_for_different_user_forbidden(
+    async def test_create_order_for_different_user_forbidden(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
-        test_user: Dict[str, Any],
     ):
         """
         TEST: Creating order for different user fails with 403 Forbidden.
@@ -488,15 +391,10 @@ class TestCreateOrderAuthentication:
         - User cannot create orders for other users
         - API validates user_id matches authenticated user
         """
-        order_data = {
-            "user_id": "different_user_123",  # Different from authenticated user
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-        }
-
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
-            json=order_data,
-            headers=auth_headers
+        response = await async_client.post(
+            ORDERS_URL,
+            content=_order_body("different_user_123"),  # Different from authenticated user
+            headers={**auth_headers, **_JSON_CONTENT_TYPE}
         )
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -509,12 +407,16 @@ class TestCreateOrderAuthentication:
 @pytest.mark.crud
 @pytest.mark.create
 @pytest.mark.validation
+@pytest.mark.asyncio
 class TestCreateOrderStatusValidation:
     """Test status field validation for new orders."""
 
-    def test_create_order_with_pending_status(
+    # Shared, read-only item list for the parametrized status cases
+    _ITEMS = ({"product_id": "p1", "name": "Item", "price": 100, "quantity": 1},)
+
+    async def test_create_order_with_pending_status(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
     ):
@@ -530,18 +432,18 @@ class TestCreateOrderStatusValidation:
             "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
         }
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
+        response = await async_client.post(
+            ORDERS_URL,
             json=order_data,
             headers=auth_headers
         )
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert response.json()["status"] == "Pending"
+        assert json_body(response)["status"] == "Pending"
 
-    def test_create_order_with_invalid_status(
+    async def test_create_order_with_invalid_status(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
     ):
@@ -558,8 +460,8 @@ class TestCreateOrderStatusValidation:
             "status": "InvalidStatus"
         }
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
+        response = await async_client.post(
+            ORDERS_URL,
             json=order_data,
             headers=auth_headers
         )
@@ -567,9 +469,9 @@ class TestCreateOrderStatusValidation:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
     @pytest.mark.parametrize("invalid_status", ["Processing", "Shipped", "Delivered", "Cancelled"])
-    def test_create_order_invalid_initial_statuses(
+    async def test_create_order_invalid_initial_statuses(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
         invalid_status: str,
@@ -585,12 +487,12 @@ class TestCreateOrderStatusValidation:
         """
         order_data = {
             "user_id": test_user["user_id"],
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
+            "items": self._ITEMS,
             "status": invalid_status
         }
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
+        response = await async_client.post(
+            ORDERS_URL,
             json=order_data,
             headers=auth_headers
         )
@@ -605,12 +507,13 @@ class TestCreateOrderStatusValidation:
 @pytest.mark.crud
 @pytest.mark.create
 @pytest.mark.validation
+@pytest.mark.asyncio
 class TestCreateOrderEdgeCases:
     """Test edge cases and boundary conditions for order creation."""
 
-    def test_create_order_with_special_characters_in_product_name(
+    async def test_create_order_with_special_characters_in_product_name(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
     ):
@@ -633,18 +536,18 @@ class TestCreateOrderEdgeCases:
             ],
         }
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
+        response = await async_client.post(
+            ORDERS_URL,
             json=order_data,
             headers=auth_headers
         )
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert "Laptop Pro" in response.json()["items"][0]["name"]
+        assert "Laptop Pro" in json_body(response)["items"][0]["name"]
 
-    def test_create_order_with_decimal_precision(
+    async def test_create_order_with_decimal_precision(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
     ):
@@ -667,19 +570,19 @@ class TestCreateOrderEdgeCases:
             ],
         }
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
+        response = await async_client.post(
+            ORDERS_URL,
             json=order_data,
             headers=auth_headers
         )
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert response.json()["total_price"] == 29.97
+        assert json_body(response)["total_price"] == 29.97
 
     @pytest.mark.slow
-    def test_create_order_with_very_large_quantity(
+    async def test_create_order_with_very_large_quantity(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
     ):
@@ -700,17 +603,17 @@ class TestCreateOrderEdgeCases:
             ],
         }
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
+        response = await async_client.post(
+            ORDERS_URL,
             json=order_data,
             headers=auth_headers
         )
 
         assert response.status_code == status.HTTP_201_CREATED
 
-    def test_create_order_invalid_order_id_format_in_response(
+    async def test_create_order_invalid_order_id_format_in_response(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
     ):
@@ -726,16 +629,109 @@ class TestCreateOrderEdgeCases:
             "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
         }
 
-        response = sync_client.post(
-            f"{FASTAPI_BASE_URL}/orders",
+        response = await async_client.post(
+            ORDERS_URL,
             json=order_data,
             headers=auth_headers
         )
 
         assert response.status_code == status.HTTP_201_CREATED
-        order_id = response.json()["_id"]
+        order_id = json_body(response)["_id"]
         
         # Verify _id is a valid MongoDB ObjectId string (24 hex chars)
         assert isinstance(order_id, str)
         assert len(order_id) == 24
-        assert all(c in "0123456789abcdef" for c in order_id)
+        assert ObjectId.is_valid(order_id)
+
+
+# ============================================================================
+# TEST CLASS: Batch Order Creation
+# ============================================================================
+
+@pytest.mark.crud
+@pytest.mark.create
+@pytest.mark.asyncio
+class TestCreateOrderBatch:
+    """Test creating several orders in one request."""
+
+    async def test_create_order_batch_success(
+        self,
+        orders_collection: Collection,
+        async_client: AsyncClient,
+        auth_headers: Dict[str, str],
+        test_user: Dict[str, Any],
+    ):
+        """
+        TEST: Create a batch of orders returns 201 Created.
+        
+        Verifies:
+        - Every order in the batch is created
+        - Response preserves request order, with computed totals
+        - Returned IDs are persisted
+        """
+        orders_data = [
+            {
+                "user_id": test_user["user_id"],
+                "items": [{"product_id": f"p{i}", "name": f"Item {i}", "price": 10.00 * (i + 1), "quantity": 2}],
+            }
+            for i in range(3)
+        ]
+
+        response = await async_client.post(
+            BATCH_ORDERS_URL,
+            json=orders_data,
+            headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        data = json_body(response)
+        assert [order["total_price"] for order in data] == [20.00, 40.00, 60.00]
+        assert all(order["status"] == "Pending" for order in data)
+        assert orders_collection.count_documents(
+            {"_id": {"$in": [ObjectId(order["_id"]) for order in data]}}
+        ) == 3
+
+    async def test_create_order_batch_for_different_user_forbidden(
+        self,
+        orders_collection: Collection,
+        async_client: AsyncClient,
+        auth_headers: Dict[str, str],
+        test_user: Dict[str, Any],
+    ):
+        """
+        TEST: A batch containing another user's order is rejected as a whole.
+        
+        Verifies:
+        - 403 Forbidden returned
+        - No order from the batch is persisted
+        """
+        item = {"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}
+        orders_data = [
+            {"user_id": test_user["user_id"], "items": [item]},
+            {"user_id": "different_user_id", "items": [item]},
+        ]
+
+        response = await async_client.post(
+            BATCH_ORDERS_URL,
+            json=orders_data,
+            headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert orders_collection.count_documents({}) == 0
+
+    async def test_create_order_batch_empty_fails(
+        self,
+        async_client: AsyncClient,
+        auth_headers: Dict[str, str],
+    ):
+        """
+        TEST: Empty batch returns 422 Unprocessable Entity.
+        """
+        response = await async_client.post(
+            BATCH_ORDERS_URL,
+            json=[],
+            headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -1,10 +1,13 @@
+import asyncio
 import pytest
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from bson import ObjectId
 from starlette import status
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from pymongo.collection import Collection
-from tests.conftest import FASTAPI_BASE_URL
+from tests.conftest import FASTAPI_BASE_URL, INVALID_OBJECT_IDS, make_order_doc
+
+ORDERS_URL = f"{FASTAPI_BASE_URL}/orders"
 
 
 # ============================================================================
@@ -13,13 +16,14 @@ from tests.conftest import FASTAPI_BASE_URL
 
 @pytest.mark.crud
 @pytest.mark.delete
+@pytest.mark.asyncio
 class TestDeleteOrderSuccess:
     """Test successful order deletion scenarios."""
 
-    def test_delete_order_success(
+    async def test_delete_order_success(
         self,
-        orders_collection: Collection,
-        sync_client: TestClient,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
     ):
@@ -28,33 +32,25 @@ class TestDeleteOrderSuccess:
         
         Verifies:
         - Valid order deletion succeeds
-        - Returns 204 No Content (or 200 OK depending on API design)
+        - Returns 204 No Content
         - Response indicates success
         """
         # Create order
-        order_data = {
-            "user_id": test_admin["user_id"],
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-            "total_price": 100.00,
-            "status": "Pending"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = result.inserted_id
+        order_id = make_order(make_order_doc(test_admin["user_id"]))
 
         # Delete order
-        response = sync_client.delete(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        response = await async_client.delete(
+            f"{ORDERS_URL}/{order_id}",
             headers=admin_headers
         )
 
-        # Typically DELETE returns 204 No Content
-        assert response.status_code in [status.HTTP_204_NO_CONTENT, status.HTTP_200_OK]
+        assert response.status_code == status.HTTP_204_NO_CONTENT
 
-    def test_delete_order_removes_from_database(
+    async def test_delete_order_removes_from_database(
         self,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
         orders_collection: Collection,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
     ):
@@ -67,113 +63,85 @@ class TestDeleteOrderSuccess:
         - Deletion is persistent
         """
         # Create order
-        order_data = {
-            "user_id": test_admin["user_id"],
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-            "total_price": 100.00,
-            "status": "Pending"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = result.inserted_id
-        order_id_obj = ObjectId(order_id)
+        order_id = make_order(make_order_doc(test_admin["user_id"]))
 
         # Verify order exists before deletion
-        get_response = orders_collection.find_one({"_id": order_id_obj})
+        get_response = orders_collection.find_one({"_id": order_id}, projection={"_id": 1})
         assert get_response is not None
 
         # Delete order
-        delete_response = sync_client.delete(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        delete_response = await async_client.delete(
+            f"{ORDERS_URL}/{order_id}",
             headers=admin_headers
         )
-        assert delete_response.status_code in [status.HTTP_204_NO_CONTENT, status.HTTP_200_OK]
+        assert delete_response.status_code == status.HTTP_204_NO_CONTENT
 
-        get_response = orders_collection.find_one({"_id": order_id_obj})
+        get_response = orders_collection.find_one({"_id": order_id}, projection={"_id": 1})
         assert get_response is None
 
-    def test_delete_multiple_orders_sequentially(
+    async def test_delete_multiple_orders(
         self,
         orders_collection: Collection,
-        sync_client: TestClient,
+        seed_orders: Callable[[List[Dict[str, Any]]], List[ObjectId]],
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
     ):
         """
-        TEST: Delete multiple orders one by one.
+        TEST: Delete multiple orders.
         
+        All deletes are sent concurrently and checked together.
         Verifies:
         - Multiple deletions work correctly
         - No interference between deletions
         """
         # Create multiple orders
-        order_ids = []
-        for i in range(3):
-            order_data = {
-                "user_id": test_admin["user_id"],
-                "items": [
-                    {
-                        "product_id": f"p{i}",
-                        "name": f"Item {i}",
-                        "price": 100.00 * (i + 1),
-                        "quantity": 1
-                    }
-                ],
-                "total_price": 100.00 * (i + 1),
-                "status": "Pending"
-            }
-
-            result = orders_collection.insert_one(order_data)
-            order_ids.append(str(result.inserted_id))
-
-        # Delete each order and verify
-        for order_id in order_ids:
-            delete_response = sync_client.delete(
-                f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        order_ids = seed_orders([
+            make_order_doc(test_admin["user_id"], price=100.00 * (i + 1), product_id=f"p{i}", name=f"Item {i}")
+            for i in range(3)
+        ])
+
+        # Delete every order at once
+        delete_responses = await asyncio.gather(*(
+            async_client.delete(
+                f"{ORDERS_URL}/{order_id}",
                 headers=admin_headers
             )
-            assert delete_response.status_code in [status.HTTP_204_NO_CONTENT, status.HTTP_200_OK]
+            for order_id in order_ids
+        ))
+
+        for order_id, delete_response in zip(order_ids, delete_responses):
+            assert delete_response.status_code == status.HTTP_204_NO_CONTENT, order_id
 
-            # Verify it's gone
-            order_obj = orders_collection.find_one({"_id": ObjectId(order_id)})
-            assert order_obj is None
+        # Verify they're all gone
+        assert orders_collection.count_documents({"_id": {"$in": order_ids}}) == 0
 
-    def test_delete_order_in_different_status(
+    @pytest.mark.parametrize("test_status", ["Pending", "Processing", "Shipped", "Delivered"])
+    async def test_delete_order_in_different_status(
         self,
-        orders_collection: Collection,
-        sync_client: TestClient,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
+        test_status: str,
     ):
         """
         TEST: Can delete orders in any status.
         
+        Parameterized over all valid statuses.
         Verifies:
         - Orders can be deleted regardless of status
-        - Applies to all valid statuses
         """
-        # Create and update order to different statuses
-        statuses_to_test = ["Pending", "Processing", "Shipped", "Delivered"]
-
-        for test_status in statuses_to_test:
-            # Create order
-            order_data = {
-                "user_id": test_admin["user_id"],
-                "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-                "total_price": 100.00,
-                "status": test_status
-            }
-
-            result = orders_collection.insert_one(order_data)
-            order_id = str(result.inserted_id)
-
-            # Delete
-            delete_response = sync_client.delete(
-                f"{FASTAPI_BASE_URL}/orders/{order_id}",
-                headers=admin_headers
-            )
+        # Create order in the given status
+        order_id = make_order(make_order_doc(test_admin["user_id"], status=test_status))
+
+        # Delete
+        delete_response = await async_client.delete(
+            f"{ORDERS_URL}/{order_id}",
+            headers=admin_headers
+        )
 
-            assert delete_response.status_code in [status.HTTP_204_NO_CONTENT, status.HTTP_200_OK]
+        assert delete_response.status_code == status.HTTP_204_NO_CONTENT
 
 
 # ============================================================================
@@ -182,12 +150,14 @@ class TestDeleteOrderSuccess:
 
 @pytest.mark.crud
 @pytest.mark.delete
+@pytest.mark.asyncio
 class TestDeleteOrderNotFound:
     """Test deleting non-existent orders."""
 
-    def test_delete_nonexistent_order_returns_404(
+    async def test_delete_nonexistent_order_returns_404(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
+        fake_order_id: str,
         admin_headers: Dict[str, str],
     ):
         """
@@ -197,19 +167,18 @@ class TestDeleteOrderNotFound:
         - Cannot delete orders that don't exist
         - Proper error handling
         """
-        fake_id = str(ObjectId())
 
-        response = sync_client.delete(
-            f"{FASTAPI_BASE_URL}/orders/{fake_id}",
+        response = await async_client.delete(
+            f"{ORDERS_URL}/{fake_order_id}",
             headers=admin_headers
         )
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    def test_delete_already_deleted_order_returns_404(
+    async def test_delete_already_deleted_order_returns_404(
         self,
-        orders_collection: Collection,
-        sync_client: TestClient,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
     ):
@@ -221,26 +190,18 @@ class TestDeleteOrderNotFound:
         - Second delete returns 404
         """
         # Create and delete order
-        order_data = {
-            "user_id": test_admin["user_id"],
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-            "total_price": 100.00,
-            "status": "Pending"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = str(result.inserted_id)
+        order_id = make_order(make_order_doc(test_admin["user_id"]))
 
         # Delete first time
-        delete_response = sync_client.delete(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        delete_response = await async_client.delete(
+            f"{ORDERS_URL}/{order_id}",
             headers=admin_headers
         )
-        assert delete_response.status_code in [status.HTTP_204_NO_CONTENT, status.HTTP_200_OK]
+        assert delete_response.status_code == status.HTTP_204_NO_CONTENT
 
         # Try to delete again
-        delete_response_2 = sync_client.delete(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        delete_response_2 = await async_client.delete(
+            f"{ORDERS_URL}/{order_id}",
             headers=admin_headers
         )
         assert delete_response_2.status_code == status.HTTP_404_NOT_FOUND
@@ -252,18 +213,14 @@ class TestDeleteOrderNotFound:
 
 @pytest.mark.crud
 @pytest.mark.delete
+@pytest.mark.asyncio
 class TestDeleteOrderInvalidId:
     """Test delete with invalid order ID format."""
 
-    @pytest.mark.parametrize("invalid_id", [
-        "not-a-valid-objectid",
-        "12345",
-        "gggggggggggggggggggggggg",
-        "!@#$%^&*()",
-    ])
-    def test_delete_invalid_id_format_fails(
+    @pytest.mark.parametrize("invalid_id", INVALID_OBJECT_IDS)
+    async def test_delete_invalid_id_format_fails(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         invalid_id: str,
     ):
@@ -275,8 +232,8 @@ class TestDeleteOrderInvalidId:
         - API validates ID format
         - Invalid formats rejected with 400
         """
-        response = sync_client.delete(
-            f"{FASTAPI_BASE_URL}/orders/{invalid_id}",
+        response = await async_client.delete(
+            f"{ORDERS_URL}/{invalid_id}",
             headers=admin_headers
         )
 
@@ -290,74 +247,77 @@ class TestDeleteOrderInvalidId:
 @pytest.mark.crud
 @pytest.mark.delete
 @pytest.mark.auth
+@pytest.mark.asyncio
 class TestDeleteOrderAuthentication:
     """Test authentication and authorization for deletions."""
 
-    def test_delete_order_by_user(
+    @pytest.mark.no_db
+    @pytest.mark.parametrize("headers,expected_status", [
+        ("auth_headers", status.HTTP_403_FORBIDDEN),
+        (None, status.HTTP_401_UNAUTHORIZED),
+        ({"Authorization": "Bearer invalid_token"}, status.HTTP_401_UNAUTHORIZED),
+    ], ids=["customer", "no_token", "invalid_token"])
+    async def test_delete_order_rejected_before_lookup(
         self,
-        sync_client: TestClient,
-        test_user: Dict[str, Any],
-        auth_headers: Dict[str, str],
+        request: pytest.FixtureRequest,
+        async_client: AsyncClient,
+        fake_order_id: str,
+        headers: Optional[Union[str, Dict[str, str]]],
+        expected_status: int,
     ):
         """
-        TEST: Users can't delete orders.
+        TEST: Deletion without admin credentials is rejected.
 
+        Parameterized over the caller; a string names a headers fixture.
         Verifies:
-        - Only admins can delete orders.
+        - Only admins can delete orders (403)
+        - Authentication required for deletion (401)
+        - Invalid tokens rejected (401)
         """
-        order_id = str(ObjectId())
+        if isinstance(headers, str):
+            headers = request.getfixturevalue(headers)
 
-        response = sync_client.delete(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
-            headers=auth_headers
+        response = await async_client.delete(
+            f"{ORDERS_URL}/{fake_order_id}",
+            headers=headers
         )
 
-        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.status_code == expected_status
 
-    def test_delete_order_without_authentication_fails(
+    @pytest.mark.no_db
+    @pytest.mark.parametrize("headers,expected_status", [
+        ("auth_headers", status.HTTP_403_FORBIDDEN),
+        (None, status.HTTP_401_UNAUTHORIZED),
+    ], ids=["customer", "no_token"])
+    async def test_delete_invalid_id_checks_auth_first(
         self,
-        sync_client: TestClient,
+        request: pytest.FixtureRequest,
+        async_client: AsyncClient,
+        headers: Optional[Union[str, Dict[str, str]]],
+        expected_status: int,
     ):
         """
-        TEST: Deleting order without authentication fails with 401.
-        
-        Verifies:
-        - Authentication required for deletion
-        - Unauthenticated requests rejected
-        """
-        order_id = str(ObjectId())
+        TEST: Auth and role are checked before the id format.
 
-        response = sync_client.delete(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}"
-        )
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_delete_order_with_invalid_token_fails(
-        self,
-        sync_client: TestClient,
-    ):
-        """
-        TEST: Deleting order with invalid token fails with 401.
-        
         Verifies:
-        - Invalid tokens rejected
+        - A malformed id gets 401/403 for callers who may not delete at all, not 400
         """
-        invalid_headers = {"Authorization": "Bearer invalid_token"}
-        order_id = str(ObjectId())
+        if isinstance(headers, str):
+            headers = request.getfixturevalue(headers)
 
-        response = sync_client.delete(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
-            headers=invalid_headers
+        response = await async_client.delete(
+            f"{ORDERS_URL}/{INVALID_OBJECT_IDS[0]}",
+            headers=headers
         )
 
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.status_code == expected_status
 
-    def test_delete_order_authorization_check(
+    async def test_delete_order_authorization_check(
         self,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
         orders_collection: Collection,
-        sync_client: TestClient,
-        admin_headers: Dict[str, str],
+        async_client: AsyncClient,
+        other_user_headers: Dict[str, str],
         test_admin: Dict[str, Any],
     ):
         """
@@ -366,38 +326,20 @@ class TestDeleteOrderAuthentication:
         Verifies:
         - Authorization enforced for deletion
         - Cannot delete other users' orders
+        - The order is left in place
         """
         # Create order for test_admin
-        order_data = {
-            "user_id": test_admin["user_id"],
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-            "total_price": 100.00,
-            "status": "Pending"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = str(result.inserted_id)
-
-        # Create different user token
-        import uuid
-        from app.auth import create_access_token
-        from datetime import timedelta
-
-        other_user_id = f"user_{uuid.uuid4().hex[:8]}"
-        other_token = create_access_token(
-            data={"sub": other_user_id, "role": "customer"},
-            expires_delta=timedelta(hours=1)
-        )
-        other_headers = {"Authorization": f"Bearer {other_token}"}
+        order_id = make_order(make_order_doc(test_admin["user_id"]))
 
         # Try to delete with different user's token
-        response = sync_client.delete(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
-            headers=other_headers
+        response = await async_client.delete(
+            f"{ORDERS_URL}/{order_id}",
+            headers=other_user_headers
         )
 
-        # Should be forbidden (403) or not found (404) depending on implementation
-        assert response.status_code in [status.HTTP_403_FORBIDDEN, status.HTTP_404_NOT_FOUND]
+        # Only admins may delete, so an existing foreign order is forbidden rather than hidden
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert orders_collection.find_one({"_id": order_id}, projection={"_id": 1}) is not None
 
 
 # ============================================================================
@@ -406,13 +348,15 @@ class TestDeleteOrderAuthentication:
 
 @pytest.mark.crud
 @pytest.mark.delete
+@pytest.mark.asyncio
 class TestDeleteOrderIdempotency:
     """Test idempotency considerations for DELETE."""
 
-    def test_delete_idempotent_concept(
+    async def test_delete_idempotent_concept(
         self,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
         orders_collection: Collection,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
     ):
@@ -426,32 +370,24 @@ class TestDeleteOrderIdempotency:
         This test documents the actual behavior.
         """
         # Create order
-        order_data = {
-            "user_id": test_admin["user_id"],
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-            "total_price": 100.00,
-            "status": "Pending"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = str(result.inserted_id)
+        order_id = make_order(make_order_doc(test_admin["user_id"]))
 
         # First delete - should succeed
-        response1 = sync_client.delete(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        response1 = await async_client.delete(
+            f"{ORDERS_URL}/{order_id}",
             headers=admin_headers
         )
-        assert response1.status_code in [status.HTTP_204_NO_CONTENT, status.HTTP_200_OK]
+        assert response1.status_code == status.HTTP_204_NO_CONTENT
 
         # Second delete - returns different status (404)
-        response2 = sync_client.delete(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        response2 = await async_client.delete(
+            f"{ORDERS_URL}/{order_id}",
             headers=admin_headers
         )
         assert response2.status_code == status.HTTP_404_NOT_FOUND
 
         # But end state is same: resource doesn't exist
-        order_obj = orders_collection.find_one({"_id": ObjectId(order_id)})
+        order_obj = orders_collection.find_one({"_id": order_id}, projection={"_id": 1})
         assert order_obj is None
 
 
@@ -461,13 +397,15 @@ class TestDeleteOrderIdempotency:
 
 @pytest.mark.crud
 @pytest.mark.delete
+@pytest.mark.asyncio
 class TestDeleteOrderSideEffects:
     """Test that deletion only affects the order, not related data."""
 
-    def test_delete_order_no_side_effects(
+    async def test_delete_order_no_side_effects(
         self,
         orders_collection: Collection,
-        sync_client: TestClient,
+        seed_orders: Callable[[List[Dict[str, Any]]], List[ObjectId]],
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
     ):
@@ -480,36 +418,107 @@ class TestDeleteOrderSideEffects:
         - User account unaffected
         """
         # Create two orders for same user
-        order_ids = []
-        for i in range(2):
-            order_data = {
-                "user_id": test_admin["user_id"],
-                "items": [
-                    {
-                        "product_id": f"p{i}",
-                        "name": f"Item {i}",
-                        "price": 100.00 * (i + 1),
-                        "quantity": 1
-                    }
-                ],
-                "total_price": 100.00 * (i + 1),
-                "status": "Pending"
-            }
-
-            result = orders_collection.insert_one(order_data)
-            order_ids.append(str(result.inserted_id))
+        order_ids = seed_orders([
+            make_order_doc(test_admin["user_id"], price=100.00 * (i + 1), product_id=f"p{i}", name=f"Item {i}")
+            for i in range(2)
+        ])
 
         # Delete first order
-        delete_response = sync_client.delete(
-            f"{FASTAPI_BASE_URL}/orders/{order_ids[0]}",
+        delete_response = await async_client.delete(
+            f"{ORDERS_URL}/{order_ids[0]}",
             headers=admin_headers
         )
-        assert delete_response.status_code in [status.HTTP_204_NO_CONTENT, status.HTTP_200_OK]
+        assert delete_response.status_code == status.HTTP_204_NO_CONTENT
 
         # Verify first order is gone
-        order_obj = orders_collection.find_one({"_id": ObjectId(order_ids[0])})
+        order_obj = orders_collection.find_one({"_id": order_ids[0]}, projection={"_id": 1})
         assert order_obj is None
 
         # Verify second order still exists
-        order_obj = orders_collection.find_one({"_id": ObjectId(order_ids[1])})
+        order_obj = orders_collection.find_one({"_id": order_ids[1]}, projection={"_id": 1})
         assert order_obj is not None
+
+
+# ============================================================================
+# TEST CLASS: Cached Reads
+# ============================================================================
+
+@pytest.mark.crud
+@pytest.mark.delete
+@pytest.mark.asyncio
+class TestDeleteOrderCachedReads:
+    """Test that deleted orders are not served from the read cache."""
+
+    async def test_read_after_delete_returns_404(
+        self,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
+        admin_headers: Dict[str, str],
+        test_admin: Dict[str, Any],
+    ):
+        """
+        TEST: Reading an order after deleting it returns 404.
+        
+        Verifies:
+        - A previously read (cached) order is evicted on DELETE
+        """
+        order_id = make_order(make_order_doc(test_admin["user_id"]))
+
+        # Read once so the order is cached
+        first_read = await async_client.get(
+            f"{ORDERS_URL}/{order_id}",
+            headers=admin_headers
+        )
+        assert first_read.status_code == status.HTTP_200_OK
+
+        delete_response = await async_client.delete(
+            f"{ORDERS_URL}/{order_id}",
+            headers=admin_headers
+        )
+        assert delete_response.status_code == status.HTTP_204_NO_CONTENT
+
+        second_read = await async_client.get(
+            f"{ORDERS_URL}/{order_id}",
+            headers=admin_headers
+        )
+        assert second_read.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_delete_during_read_is_not_served_stale(
+        self,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
+        admin_headers: Dict[str, str],
+        test_admin: Dict[str, Any],
+        hold_order_lookup: Tuple[asyncio.Event, asyncio.Event],
+    ):
+        """
+        TEST: A read that fetched the order before a DELETE doesn't cache it.
+        
+        Verifies:
+        - The in-flight read still returns what it fetched
+        - The next read returns 404
+        """
+        order_id = make_order(make_order_doc(test_admin["user_id"]))
+        reached, release = hold_order_lookup
+
+        # Start a read and hold it once it has fetched the document
+        read_task = asyncio.ensure_future(
+            async_client.get(f"{ORDERS_URL}/{order_id}", headers=admin_headers)
+        )
+        await reached.wait()
+
+        # Delete while the read is in flight, then let it finish
+        delete_response = await async_client.delete(
+            f"{ORDERS_URL}/{order_id}",
+            headers=admin_headers
+        )
+        assert delete_response.status_code == status.HTTP_204_NO_CONTENT
+        release.set()
+        stale_read = await read_task
+        assert stale_read.status_code == status.HTTP_200_OK
+
+        fresh_read = await async_client.get(
+            f"{ORDERS_URL}/{order_id}",
+            headers=admin_headers
+        )
+        assert fresh_read.status_code == status.HTTP_404_NOT_FOUND
@@ -1,10 +1,12 @@
 import pytest
-from typing import Dict, Any
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
 from bson import ObjectId
 from starlette import status
-from fastapi.testclient import TestClient
-from pymongo.collection import Collection
-from tests.conftest import FASTAPI_BASE_URL
+from httpx import AsyncClient
+from tests.conftest import FASTAPI_BASE_URL, INVALID_OBJECT_IDS, json_body, make_order_doc
+
+ORDERS_URL = f"{FASTAPI_BASE_URL}/orders"
 
 
 # ============================================================================
@@ -13,13 +15,14 @@ from tests.conftest import FASTAPI_BASE_URL
 
 @pytest.mark.crud
 @pytest.mark.read
+@pytest.mark.asyncio
 class TestReadOrderSuccess:
     """Test successful order retrieval scenarios."""
 
-    def test_read_order_by_id_success(
+    async def test_read_order_by_id_success(
         self,
-        orders_collection: Collection,
-        sync_client: TestClient,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
     ):
@@ -33,34 +36,21 @@ class TestReadOrderSuccess:
         - Timestamps present (created_at, updated_at)
         """
         # First, create an order
-        order_data = {
-            "user_id": test_user["user_id"],
-            "items": [
-                {
-                    "product_id": "p001",
-                    "name": "Laptop",
-                    "price": 1200.00,
-                    "quantity": 1
-                }
-            ],
-            "total_price": 1200.00,
-            "status": "Pending"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = str(result.inserted_id)
+        order_id = make_order(make_order_doc(
+            test_user["user_id"], price=1200.00, product_id="p001", name="Laptop"
+        ))
 
         # Now retrieve it
-        response = sync_client.get(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        response = await async_client.get(
+            f"{ORDERS_URL}/{order_id}",
             headers=auth_headers
         )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = json_body(response)
         
         # Verify all fields present
-        assert data["_id"] == order_id
+        assert data["_id"] == str(order_id)
         assert data["user_id"] == test_user["user_id"]
         assert data["total_price"] == 1200.00
         assert data["status"] == "Pending"
@@ -68,10 +58,10 @@ class TestReadOrderSuccess:
         assert "created_at" in data
         assert "updated_at" in data
 
-    def test_read_multiple_orders_sequential(
+    async def test_read_multiple_orders_sequential(
         self,
-        orders_collection: Collection,
-        sync_client: TestClient,
+        seed_orders: Callable[[List[Dict[str, Any]]], List[ObjectId]],
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
     ):
@@ -84,39 +74,25 @@ class TestReadOrderSuccess:
         - Correct data returned for each order
         """
         # Create two orders
-        order_ids = []
-        for i in range(2):
-            order_data = {
-                "user_id": test_user["user_id"],
-                "items": [
-                    {
-                        "product_id": f"p{i}",
-                        "name": f"Item {i}",
-                        "price": 100.00 * (i + 1),
-                        "quantity": 1
-                    }
-                ],
-                "total_price": 100.00 * (i + 1),
-                "status": "Pending"
-            }
-
-            result = orders_collection.insert_one(order_data)
-            order_ids.append(str(result.inserted_id))
+        order_ids = seed_orders([
+            make_order_doc(test_user["user_id"], price=100.00 * (i + 1), product_id=f"p{i}", name=f"Item {i}")
+            for i in range(2)
+        ])
 
         # Retrieve both orders
         for i, order_id in enumerate(order_ids):
-            response = sync_client.get(
-                f"{FASTAPI_BASE_URL}/orders/{order_id}",
+            response = await async_client.get(
+                f"{ORDERS_URL}/{order_id}",
                 headers=auth_headers
             )
 
             assert response.status_code == status.HTTP_200_OK
-            assert response.json()["total_price"] == 100.00 * (i + 1)
+            assert json_body(response)["total_price"] == 100.00 * (i + 1)
 
-    def test_read_order_response_structure(
+    async def test_read_order_response_structure(
         self,
-        orders_collection: Collection,
-        sync_client: TestClient,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         test_user: Dict[str, Any],
     ):
@@ -129,30 +105,17 @@ class TestReadOrderSuccess:
         - No extra/unexpected fields
         """
         # Create order
-        order_data = {
-            "user_id": test_user["user_id"],
-            "items": [
-                {
-                    "product_id": "p001",
-                    "name": "Laptop",
-                    "price": 1200.00,
-                    "quantity": 1
-                }
-            ],
-            "total_price": 1200.00,
-            "status": "Pending"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = str(result.inserted_id)
+        order_id = make_order(make_order_doc(
+            test_user["user_id"], price=1200.00, product_id="p001", name="Laptop"
+        ))
 
         # Read and validate structure
-        response = sync_client.get(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        response = await async_client.get(
+            f"{ORDERS_URL}/{order_id}",
             headers=auth_headers
         )
 
-        data = response.json()
+        data = json_body(response)
         
         # Verify required fields and types
         assert isinstance(data["_id"], str)
@@ -170,6 +133,41 @@ class TestReadOrderSuccess:
             assert isinstance(item["price"], (int, float))
             assert isinstance(item["quantity"], int)
 
+    async def test_read_order_matches_list_representation(
+        self,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
+        auth_headers: Dict[str, str],
+        test_user: Dict[str, Any],
+    ):
+        """
+        TEST: GET by id and the list endpoint render the same stored order identically.
+        
+        Verifies:
+        - total_price is recomputed from the items, not echoed from the document
+        - A missing status gets the model default
+        """
+        order_doc = make_order_doc(test_user["user_id"])
+        order_doc["total_price"] = 999.00
+        del order_doc["status"]
+        # fixed timestamps, so neither endpoint falls back to "now"
+        order_doc["created_at"] = order_doc["updated_at"] = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        order_id = make_order(order_doc)
+
+        response = await async_client.get(
+            f"{ORDERS_URL}/{order_id}",
+            headers=auth_headers
+        )
+        list_response = await async_client.get(ORDERS_URL, headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert list_response.status_code == status.HTTP_200_OK
+        data = json_body(response)
+        [listed] = json_body(list_response)["orders"]
+        assert data == listed
+        assert data["total_price"] == 100.00
+        assert data["status"] == "Pending"
+
 
 # ============================================================================
 # TEST CLASS: Not Found Errors
@@ -177,12 +175,14 @@ class TestReadOrderSuccess:
 
 @pytest.mark.crud
 @pytest.mark.read
+@pytest.mark.asyncio
 class TestReadOrderNotFound:
     """Test 404 Not Found scenarios."""
 
-    def test_read_nonexistent_order_returns_404(
+    async def test_read_nonexistent_order_returns_404(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
+        fake_order_id: str,
         auth_headers: Dict[str, str],
     ):
         """
@@ -192,11 +192,9 @@ class TestReadOrderNotFound:
         - Non-existent order IDs return 404
         - Proper error handling
         """
-        # Use valid ObjectId format but doesn't exist
-        fake_id = str(ObjectId())
-
-        response = sync_client.get(
-            f"{FASTAPI_BASE_URL}/orders/{fake_id}",
+        # fake_order_id has a valid ObjectId format but doesn't exist
+        response = await async_client.get(
+            f"{ORDERS_URL}/{fake_order_id}",
             headers=auth_headers
         )
 
@@ -209,20 +207,14 @@ class TestReadOrderNotFound:
 
 @pytest.mark.crud
 @pytest.mark.read
+@pytest.mark.asyncio
 class TestReadOrderInvalidId:
     """Test invalid order ID format handling."""
 
-    @pytest.mark.parametrize("invalid_id", [
-        "not-a-valid-objectid",
-        "12345",
-        "invalid",
-        "!@#$%",
-        "123456789012345",  # Wrong length
-        "gggggggggggggggggggggggg",  # Invalid hex characters
-    ])
-    def test_read_invalid_id_format_fails(
+    @pytest.mark.parametrize("invalid_id", INVALID_OBJECT_IDS)
+    async def test_read_invalid_id_format_fails(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
         invalid_id: str,
     ):
@@ -234,16 +226,16 @@ class TestReadOrderInvalidId:
         - API validates ID format
         - Invalid formats rejected with 400
         """
-        response = sync_client.get(
-            f"{FASTAPI_BASE_URL}/orders/{invalid_id}",
+        response = await async_client.get(
+            f"{ORDERS_URL}/{invalid_id}",
             headers=auth_headers
         )
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_read_empty_id_fails(
+    async def test_read_empty_id_fails(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
     ):
         """
@@ -252,8 +244,8 @@ class TestReadOrderInvalidId:
         Verifies:
         - Empty ID handled properly
         """
-        response = sync_client.get(
-            f"{FASTAPI_BASE_URL}/orders/ ",
+        response = await async_client.get(
+            f"{ORDERS_URL}/ ",
             headers=auth_headers
         )
 
@@ -272,53 +264,57 @@ class TestReadOrderInvalidId:
 @pytest.mark.crud
 @pytest.mark.read
 @pytest.mark.auth
+@pytest.mark.asyncio
 class TestReadOrderAuthentication:
     """Test authentication and authorization for reading orders."""
 
-    def test_read_order_without_authentication_fails(
+    @pytest.mark.no_db
+    @pytest.mark.parametrize("headers", [
+        None,
+        {"Authorization": "Bearer invalid_token"},
+    ], ids=["no_token", "invalid_token"])
+    async def test_read_order_unauthenticated_fails(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
+        fake_order_id: str,
+        headers: Optional[Dict[str, str]],
     ):
         """
-        TEST: Reading order without authentication fails with 401.
+        TEST: Reading order without valid credentials fails with 401.
         
+        Parameterized over a missing and an invalid token.
         Verifies:
         - Authentication required for reading orders
-        - Unauthenticated requests rejected
+        - Invalid tokens rejected
         """
-        order_id = str(ObjectId())
-
-        response = sync_client.get(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}"
+        response = await async_client.get(
+            f"{ORDERS_URL}/{fake_order_id}",
+            headers=headers
         )
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_read_order_with_invalid_token_fails(
+    @pytest.mark.no_db
+    async def test_read_invalid_id_without_authentication_fails(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
     ):
         """
-        TEST: Reading order with invalid token fails with 401.
+        TEST: Authentication is checked before the id format.
         
         Verifies:
-        - Invalid tokens rejected
+        - A malformed id without a token gets 401, not 400
         """
-        invalid_headers = {"Authorization": "Bearer invalid_token"}
-        order_id = str(ObjectId())
-
-        response = sync_client.get(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
-            headers=invalid_headers
-        )
+        response = await async_client.get(f"{ORDERS_URL}/{INVALID_OBJECT_IDS[0]}")
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_read_other_users_order_forbidden(
+    async def test_read_other_users_order_forbidden(
         self,
-        orders_collection: Collection,
-        sync_client: TestClient,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
         auth_headers: Dict[str, str],
+        other_user_headers: Dict[str, str],
         test_user: Dict[str, Any],
     ):
         """
@@ -330,32 +326,12 @@ class TestReadOrderAuthentication:
         - 403 Forbidden returned
         """
         # Create order for test_user
-        order_data = {
-            "user_id": test_user["user_id"],
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-            "total_price": 100.00,
-            "status": "Pending"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = str(result.inserted_id)
-
-        # Create different user token
-        import uuid
-        from app.auth import create_access_token
-        from datetime import timedelta
-
-        other_user_id = f"user_{uuid.uuid4().hex[:8]}"
-        other_token = create_access_token(
-            data={"sub": other_user_id, "role": "customer"},
-            expires_delta=timedelta(hours=1)
-        )
-        other_headers = {"Authorization": f"Bearer {other_token}"}
+        order_id = make_order(make_order_doc(test_user["user_id"]))
 
         # Try to read with different user's token
-        response = sync_client.get(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
-            headers=other_headers
+        response = await async_client.get(
+            f"{ORDERS_URL}/{order_id}",
+            headers=other_user_headers
         )
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -1,12 +1,15 @@
 
+import asyncio
 import pytest
-from time import sleep
-from typing import Dict, Any
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 from bson import ObjectId
 from starlette import status
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from pymongo.collection import Collection
-from tests.conftest import FASTAPI_BASE_URL
+from tests.conftest import FASTAPI_BASE_URL, INVALID_OBJECT_IDS, json_body, make_order_doc
+
+ORDERS_URL = f"{FASTAPI_BASE_URL}/orders"
 
 
 # ============================================================================
@@ -15,13 +18,14 @@ from tests.conftest import FASTAPI_BASE_URL
 
 @pytest.mark.crud
 @pytest.mark.update
+@pytest.mark.asyncio
 class TestUpdateOrderSuccess:
     """Test successful order status updates."""
 
-    def test_update_order_status_pending_to_processing(
+    async def test_update_order_status_pending_to_processing(
         self,
-        orders_collection: Collection,
-        sync_client: TestClient,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
     ):
@@ -33,37 +37,30 @@ class TestUpdateOrderSuccess:
         - Returns 200 OK
         - Response contains updated status
         - Timestamp (updated_at) refreshed
+        - created_at unchanged
         """
-        # Create order
-        order_data = {
-            "user_id": test_admin["user_id"],
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-            "total_price": 100.00,
-            "status": "Pending"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = str(result.inserted_id)
-        original_order = orders_collection.find_one({"_id": result.inserted_id})
-        original_updated_at = original_order.get("updated_at")
-        sleep(1)
+        # Create order (make_order_doc stamps both timestamps in the past)
+        order_doc = make_order_doc(test_admin["user_id"])
+        order_id = make_order(order_doc)
+
         # Update status
         update_data = {"status": "Processing"}
-        response = sync_client.patch(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        response = await async_client.patch(
+            f"{ORDERS_URL}/{order_id}",
             json=update_data,
             headers=admin_headers
         )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = json_body(response)
         assert data["status"] == "Processing"
-        assert data["updated_at"] != original_updated_at  # Timestamp changed
+        assert datetime.fromisoformat(data["updated_at"]) > order_doc["updated_at"]  # Timestamp refreshed
+        assert datetime.fromisoformat(data["created_at"]) == order_doc["created_at"]
 
-    def test_update_order_status_processing_to_shipped(
+    async def test_update_order_status_processing_to_shipped(
         self,
-        orders_collection: Collection,
-        sync_client: TestClient,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
     ):
@@ -73,30 +70,22 @@ class TestUpdateOrderSuccess:
         Valid transition: Processing → Shipped
         """
         # Create order in Processing status
-        order_data = {
-            "user_id": test_admin["user_id"],
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-            "total_price": 100.00,
-            "status": "Processing"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = str(result.inserted_id)
+        order_id = make_order(make_order_doc(test_admin["user_id"], status="Processing"))
 
         # Update to Shipped
-        response = sync_client.patch(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        response = await async_client.patch(
+            f"{ORDERS_URL}/{order_id}",
             json={"status": "Shipped"},
             headers=admin_headers
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.json()["status"] == "Shipped"
+        assert json_body(response)["status"] == "Shipped"
 
-    def test_update_order_status_shipped_to_delivered(
+    async def test_update_order_status_shipped_to_delivered(
         self,
-        orders_collection: Collection,
-        sync_client: TestClient,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
     ):
@@ -106,66 +95,41 @@ class TestUpdateOrderSuccess:
         Valid transition: Shipped → Delivered
         """
         # Create order in Shipped status
-        order_data = {
-            "user_id": test_admin["user_id"],
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-            "total_price": 100.00,
-            "status": "Shipped"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = str(result.inserted_id)
+        order_id = make_order(make_order_doc(test_admin["user_id"], status="Shipped"))
 
         # Update to Delivered
-        response = sync_client.patch(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        response = await async_client.patch(
+            f"{ORDERS_URL}/{order_id}",
             json={"status": "Delivered"},
             headers=admin_headers
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.json()["status"] == "Delivered"
-
-    @pytest.mark.parametrize("transitions", [
-        ("Pending", "Processing"),
-        ("Processing", "Shipped"),
-        ("Shipped", "Delivered"),
-    ])
-    def test_update_order_valid_transitions(
+        assert json_body(response)["status"] == "Delivered"
+
+    async def test_update_order_valid_transitions(
         self,
-        orders_collection: Collection,
-        sync_client: TestClient,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
-        transitions: tuple,
     ):
         """
         TEST: All valid status transitions work correctly.
         
-        Parameterized test for all valid transitions.
+        Walks a single order through the whole lifecycle, one PATCH per transition.
         """
-        from_status, to_status = transitions
-
-        # Create order at initial status
-        order_data = {
-            "user_id": test_admin["user_id"],
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-            "total_price": 100.00,
-            "status": from_status
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = str(result.inserted_id)
-
-        # Now test the transition
-        response = sync_client.patch(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
-            json={"status": to_status},
-            headers=admin_headers
-        )
+        order_id = make_order(make_order_doc(test_admin["user_id"]))
 
-        assert response.status_code == status.HTTP_200_OK
-        assert response.json()["status"] == to_status
+        for to_status in ("Processing", "Shipped", "Delivered"):
+            response = await async_client.patch(
+                f"{ORDERS_URL}/{order_id}",
+                json={"status": to_status},
+                headers=admin_headers
+            )
+
+            assert response.status_code == status.HTTP_200_OK, to_status
+            assert json_body(response)["status"] == to_status
 
 
 # ============================================================================
@@ -174,12 +138,13 @@ class TestUpdateOrderSuccess:
 
 @pytest.mark.crud
 @pytest.mark.update
+@pytest.mark.asyncio
 class TestUpdateOrderInvalidTransitions:
     """Test invalid status transitions are rejected."""
-    def test_update_order_invalid_status_value(
+    async def test_update_order_invalid_status_value(
         self,
-        orders_collection: Collection,
-        sync_client: TestClient,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
     ):
@@ -189,19 +154,11 @@ class TestUpdateOrderInvalidTransitions:
         From test_edge_cases.py - validates status field.
         """
         # Create order
-        order_data = {
-            "user_id": test_admin["user_id"],
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-            "total_price": 100.00,
-            "status": "Pending"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = str(result.inserted_id)
+        order_id = make_order(make_order_doc(test_admin["user_id"]))
 
         # Try invalid status value
-        response = sync_client.patch(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        response = await async_client.patch(
+            f"{ORDERS_URL}/{order_id}",
             json={"status": "InvalidStatus"},
             headers=admin_headers
         )
@@ -215,12 +172,14 @@ class TestUpdateOrderInvalidTransitions:
 
 @pytest.mark.crud
 @pytest.mark.update
+@pytest.mark.asyncio
 class TestUpdateOrderNotFound:
     """Test updating non-existent orders."""
 
-    def test_update_nonexistent_order_returns_404(
+    async def test_update_nonexistent_order_returns_404(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
+        fake_order_id: str,
         admin_headers: Dict[str, str],
     ):
         """
@@ -230,10 +189,9 @@ class TestUpdateOrderNotFound:
         - Cannot update orders that don't exist
         - Proper error handling
         """
-        fake_id = str(ObjectId())
 
-        response = sync_client.patch(
-            f"{FASTAPI_BASE_URL}/orders/{fake_id}",
+        response = await async_client.patch(
+            f"{ORDERS_URL}/{fake_order_id}",
             json={"status": "Processing"},
             headers=admin_headers
         )
@@ -247,17 +205,14 @@ class TestUpdateOrderNotFound:
 
 @pytest.mark.crud
 @pytest.mark.update
+@pytest.mark.asyncio
 class TestUpdateOrderInvalidId:
     """Test update with invalid order ID format."""
 
-    @pytest.mark.parametrize("invalid_id", [
-        "not-a-valid-objectid",
-        "12345",
-        "gggggggggggggggggggggggg",
-    ])
-    def test_update_invalid_id_format_fails(
+    @pytest.mark.parametrize("invalid_id", INVALID_OBJECT_IDS)
+    async def test_update_invalid_id_format_fails(
         self,
-        sync_client: TestClient,
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         invalid_id: str,
     ):
@@ -266,8 +221,8 @@ class TestUpdateOrderInvalidId:
         
         Parameterized for multiple invalid formats.
         """
-        response = sync_client.patch(
-            f"{FASTAPI_BASE_URL}/orders/{invalid_id}",
+        response = await async_client.patch(
+            f"{ORDERS_URL}/{invalid_id}",
             json={"status": "Processing"},
             headers=admin_headers
         )
@@ -282,61 +237,68 @@ class TestUpdateOrderInvalidId:
 @pytest.mark.crud
 @pytest.mark.update
 @pytest.mark.auth
+@pytest.mark.asyncio
 class TestUpdateOrderAuthentication:
     """Test authentication and authorization for updates."""
 
-    def test_update_order_without_authentication_fails(
+    @pytest.mark.no_db
+    @pytest.mark.parametrize("headers,expected_status", [
+        ("auth_headers", status.HTTP_403_FORBIDDEN),
+        (None, status.HTTP_401_UNAUTHORIZED),
+    ], ids=["customer", "no_token"])
+    async def test_update_invalid_id_checks_auth_first(
         self,
-        sync_client: TestClient,
+        request: pytest.FixtureRequest,
+        async_client: AsyncClient,
+        headers: Optional[Union[str, Dict[str, str]]],
+        expected_status: int,
     ):
         """
-        TEST: Updating order without authentication fails with 401.
-        """
-        order_id = str(ObjectId())
+        TEST: Auth and role are checked before the id format.
 
-        response = sync_client.patch(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
-            json={"status": "Processing"}
-        )
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_update_order_with_invalid_token_fails(
-        self,
-        sync_client: TestClient,
-    ):
-        """
-        TEST: Updating order with invalid token fails with 401.
+        Verifies:
+        - A malformed id gets 401/403 for callers who may not update at all, not 400
         """
-        invalid_headers = {"Authorization": "Bearer invalid_token"}
-        order_id = str(ObjectId())
+        if isinstance(headers, str):
+            headers = request.getfixturevalue(headers)
 
-        response = sync_client.patch(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        response = await async_client.patch(
+            f"{ORDERS_URL}/{INVALID_OBJECT_IDS[0]}",
             json={"status": "Processing"},
-            headers=invalid_headers
+            headers=headers
         )
 
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.status_code == expected_status
 
-    def test_update_order_by_user(
+    @pytest.mark.no_db
+    @pytest.mark.parametrize("headers,expected_status", [
+        ("auth_headers", status.HTTP_403_FORBIDDEN),
+        (None, status.HTTP_401_UNAUTHORIZED),
+        ({"Authorization": "Bearer invalid_token"}, status.HTTP_401_UNAUTHORIZED),
+    ], ids=["customer", "no_token", "invalid_token"])
+    async def test_update_order_rejected_before_lookup(
         self,
-        sync_client: TestClient,
-        auth_headers: Dict[str, str],
-        test_user: Dict[str, Any],
+        request: pytest.FixtureRequest,
+        async_client: AsyncClient,
+        fake_order_id: str,
+        headers: Optional[Union[str, Dict[str, str]]],
+        expected_status: int,
     ):
         """
-        TEST: Updating order by user fails with 403.
+        TEST: Updating order without admin credentials is rejected.
+
+        Parameterized over the caller; a string names a headers fixture.
         """
-        order_id = str(ObjectId())
+        if isinstance(headers, str):
+            headers = request.getfixturevalue(headers)
 
-        response = sync_client.patch(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        response = await async_client.patch(
+            f"{ORDERS_URL}/{fake_order_id}",
             json={"status": "Processing"},
-            headers=auth_headers
+            headers=headers
         )
 
-        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.status_code == expected_status
 
 
 # ============================================================================
@@ -345,13 +307,15 @@ class TestUpdateOrderAuthentication:
 
 @pytest.mark.crud
 @pytest.mark.update
+@pytest.mark.asyncio
 class TestUpdateOrderVerification:
     """Test that updates are properly persisted."""
 
-    def test_update_persists_to_database(
+    async def test_update_persists_to_database(
         self,
         orders_collection: Collection,
-        sync_client: TestClient,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
     ):
@@ -363,32 +327,27 @@ class TestUpdateOrderVerification:
         - Read after update returns updated value
         """
         # Create order
-        order_data = {
-            "user_id": test_admin["user_id"],
-            "items": [{"product_id": "p1", "name": "Item", "price": 100, "quantity": 1}],
-            "total_price": 100.00,
-            "status": "Pending"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = str(result.inserted_id)
+        order_id = make_order(make_order_doc(test_admin["user_id"]))
 
         # Update status
-        update_response = sync_client.patch(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        update_response = await async_client.patch(
+            f"{ORDERS_URL}/{order_id}",
             json={"status": "Processing"},
             headers=admin_headers
         )
         assert update_response.status_code == status.HTTP_200_OK
+        # find_one_and_update returns the post-update document, so the response reflects it
+        assert json_body(update_response)["status"] == "Processing"
 
-        # Read to verify persistence
-        updated_order = orders_collection.find_one({"_id": ObjectId(order_id)})
+        # Read straight from Mongo to verify persistence
+        updated_order = orders_collection.find_one({"_id": order_id}, projection={"status": 1})
         assert updated_order["status"] == "Processing"
 
-    def test_update_other_fields_unchanged(
+    async def test_update_other_fields_unchanged(
         self,
         orders_collection: Collection,
-        sync_client: TestClient,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
         admin_headers: Dict[str, str],
         test_admin: Dict[str, Any],
     ):
@@ -399,39 +358,118 @@ class TestUpdateOrderVerification:
         - Only status updated
         - user_id, items, total_price unchanged
         - created_at unchanged
+        - updated_at moved forward
         """
-        # Create order
-        order_data = {
-            "user_id": test_admin["user_id"],
-            "items": [
-                {"product_id": "p1", "name": "Item", "price": 100, "quantity": 1},
-                {"product_id": "p2", "name": "Item2", "price": 50, "quantity": 2}
-            ],
-            "total_price": 200.00,
-            "status": "Pending"
-        }
-
-        result = orders_collection.insert_one(order_data)
-        order_id = str(result.inserted_id)
-        created_data = orders_collection.find_one({"_id": result.inserted_id})
-
-        sleep(1)
+        # Create order (make_order_doc stamps both timestamps in the past)
+        order_data = make_order_doc(test_admin["user_id"])
+        order_data["items"] = [
+            {"product_id": "p1", "name": "Item", "price": 100, "quantity": 1},
+            {"product_id": "p2", "name": "Item2", "price": 50, "quantity": 2}
+        ]
+        order_data["total_price"] = 200.00
+
+        order_id = make_order(order_data)
+        created_data = orders_collection.find_one({"_id": order_id})
+
         # Update status
-        sync_client.patch(
-            f"{FASTAPI_BASE_URL}/orders/{order_id}",
+        await async_client.patch(
+            f"{ORDERS_URL}/{order_id}",
             json={"status": "Processing"},
             headers=admin_headers
         )
 
         # Read and verify
-        updated_data = orders_collection.find_one({"_id": ObjectId(order_id)})
+        updated_data = orders_collection.find_one({"_id": order_id})
 
         # Verify unchanged fields
         assert updated_data["user_id"] == created_data["user_id"]
         assert len(updated_data["items"]) == 2
         assert updated_data["total_price"] == 200.00
-        assert updated_data.get("created_at") == created_data.get("created_at")
+        assert created_data["created_at"] is not None
+        assert updated_data["created_at"] == created_data["created_at"]
         
         # Verify changed fields
         assert updated_data["status"] == "Processing"
-        assert updated_data.get("updated_at") != created_data.get("updated_at")
+        assert updated_data["updated_at"] > created_data["updated_at"]
+
+    async def test_read_after_update_returns_updated_order(
+        self,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
+        admin_headers: Dict[str, str],
+        test_admin: Dict[str, Any],
+    ):
+        """
+        TEST: Reading an order after updating it returns the new state.
+        
+        Verifies:
+        - A previously read (cached) order is not served stale after PATCH
+        """
+        # Create order
+        order_id = make_order(make_order_doc(test_admin["user_id"]))
+
+        # Read once so the order is cached
+        first_read = await async_client.get(
+            f"{ORDERS_URL}/{order_id}",
+            headers=admin_headers
+        )
+        assert json_body(first_read)["status"] == "Pending"
+
+        # Update status
+        update_response = await async_client.patch(
+            f"{ORDERS_URL}/{order_id}",
+            json={"status": "Processing"},
+            headers=admin_headers
+        )
+        assert update_response.status_code == status.HTTP_200_OK
+
+        # Read again
+        second_read = await async_client.get(
+            f"{ORDERS_URL}/{order_id}",
+            headers=admin_headers
+        )
+        assert second_read.status_code == status.HTTP_200_OK
+        assert json_body(second_read)["status"] == "Processing"
+
+    async def test_update_during_read_is_not_served_stale(
+        self,
+        make_order: Callable[[Dict[str, Any]], ObjectId],
+        async_client: AsyncClient,
+        admin_headers: Dict[str, str],
+        test_admin: Dict[str, Any],
+        hold_order_lookup: Tuple[asyncio.Event, asyncio.Event],
+    ):
+        """
+        TEST: A read that fetched the order before a PATCH doesn't cache the old state.
+        
+        Verifies:
+        - The in-flight read still returns what it fetched
+        - The next read sees the update
+        """
+        order_id = make_order(make_order_doc(test_admin["user_id"]))
+        reached, release = hold_order_lookup
+
+        # Start a read and hold it once it has fetched the document
+        read_task = asyncio.ensure_future(
+            async_client.get(f"{ORDERS_URL}/{order_id}", headers=admin_headers)
+        )
+        await reached.wait()
+
+        # Update while the read is in flight, then let it finish
+        update_response = await async_client.patch(
+            f"{ORDERS_URL}/{order_id}",
+            json={"status": "Processing"},
+            headers=admin_headers
+        )
+        assert update_response.status_code == status.HTTP_200_OK
+        release.set()
+        stale_read = await read_task
+        assert json_body(stale_read)["status"] == "Pending"
+
+        # Read again
+        fresh_read = await async_client.get(
+            f"{ORDERS_URL}/{order_id}",
+            headers=admin_headers
+        )
+        assert fresh_read.status_code == status.HTTP_200_OK
+        assert json_body(fresh_read)["status"] == "Processing"